@@ -134,6 +134,10 @@ USE_TZ = True
 
 AUTH_USER_MODEL = "tracker.Employee"
 
+# Load the session user with select_related("position") so views can use
+# request.user without re-fetching the Employee
+AUTHENTICATION_BACKENDS = ["tracker.backends.PositionSelectRelatedBackend"]
+
 LOGIN_REDIRECT_URL = "/profile/"
 LOGOUT_REDIRECT_URL = "/"
 
@@ -1,11 +1,44 @@
+from functools import cached_property
+
 from django.contrib import admin
 from django.contrib.admin import SimpleListFilter
 from django.contrib.auth import get_user_model
 from django.contrib.auth.admin import UserAdmin
+from django.core.paginator import Paginator
+from django.db import connection
 
 from tracker.models import TaskType, Position, Employee, Project, Task, Team, Comment
 
 
+class EstimateCountPaginator(Paginator):
+    """Paginator that estimates the row count from pg_class.reltuples.
+
+    The exact COUNT(*) the default paginator runs is a full table scan
+    on PostgreSQL; for large changelists the planner's estimate is close
+    enough for page links and costs microseconds.
+    """
+
+    @cached_property
+    def count(self):
+        if connection.vendor != "postgresql":
+            return super().count
+        # The estimate covers the whole table; once search or filters
+        # add a WHERE clause only an exact count is meaningful
+        if self.object_list.query.where:
+            return super().count
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT reltuples::bigint FROM pg_class WHERE relname = %s",
+                [self.object_list.model._meta.db_table],
+            )
+            row = cursor.fetchone()
+        # reltuples is -1 (or the row is missing) before the first
+        # VACUUM/ANALYZE; fall back to the exact count then
+        if row is None or row[0] < 0:
+            return super().count
+        return row[0]
+
+
 @admin.register(TaskType)
 class TaskTypeAdmin(admin.ModelAdmin):
     list_display = ["name"]
@@ -45,15 +78,31 @@ class UserFilter(SimpleListFilter):
     parameter_name = None
     field_name = None
 
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Build the filter lookup once per subclass instead of
+        # formatting it on every request
+        if cls.field_name:
+            cls._lookup = f"{cls.field_name}__id"
+
     def lookups(self, request, model_admin):
-       # Get the list of users for filtering
-        return [(user.id, user.username) for user in get_user_model().objects.all()]
+       # Fetch only the id/username pairs instead of hydrating full models.
+       # Cache on the request so every UserFilter subclass on the page
+       # shares a single user-table query.
+        choices = getattr(request, "_userfilter_cache", None)
+        if choices is None:
+            choices = list(
+                get_user_model()
+                .objects.values_list("id", "username")
+                .order_by("username")
+            )
+            request._userfilter_cache = choices
+        return choices
 
     def queryset(self, request, queryset):
         if self.value():
-           # Filter by the specified field (field_name))
-            filter_kwargs = {f"{self.field_name}__id": self.value()}
-            return queryset.filter(**filter_kwargs)
+           # Filter by the precomputed lookup for field_name
+            return queryset.filter(**{self._lookup: self.value()})
         return queryset
 
 
@@ -65,24 +114,24 @@ class MemberFilter(UserFilter):
 
 @admin.register(Team)
 class TeamAdmin(admin.ModelAdmin):
-    list_display = ["name", "description", "get_members"]
+    # member_count is denormalized on the model, so the changelist no
+    # longer needs the members prefetch
+    list_display = ["name", "description", "member_count"]
     list_filter = [MemberFilter]
     search_fields = [
         "name",
         "description",
     ]
 
-    def get_members(self, obj):
-        return ", ".join([member.username for member in obj.members.all()])
-
-    get_members.short_description = "Members"
-
 
 @admin.register(Project)
 class ProjectAdmin(admin.ModelAdmin):
+    list_select_related = ("team",)
     list_display = ["name", "description", "deadline", "is_completed", "team"]
-    list_filter = ["deadline", "is_completed", "team__name"]
-    search_fields = ["name", "description", "deadline", "is_completed", "team__name"]
+    list_filter = ["deadline", "is_completed", ("team", admin.RelatedOnlyFieldListFilter)]
+    # Text columns only: icontains over date/bool columns forces a cast
+    # and a sequential scan; those are covered by list_filter instead
+    search_fields = ["name", "description", "team__name"]
 
 
 class AssigneeFilter(UserFilter):
@@ -93,6 +142,9 @@ class AssigneeFilter(UserFilter):
 
 @admin.register(Task)
 class TaskAdmin(admin.ModelAdmin):
+    paginator = EstimateCountPaginator
+    show_full_result_count = False
+    list_select_related = ("project", "task_type")
     list_display = [
         "name",
         "description",
@@ -110,18 +162,26 @@ class TaskAdmin(admin.ModelAdmin):
         "priority",
         "task_type__name",
         AssigneeFilter,
-        "project__name",
+        ("project", admin.RelatedOnlyFieldListFilter),
     ]
+    # Text columns only: deadline/created_at/priority are low-cardinality
+    # or non-text and are already exposed through list_filter
     search_fields = [
         "name",
         "description",
-        "deadline",
-        "created_at",
-        "priority",
         "task_type__name",
         "project__name",
     ]
 
+    def get_queryset(self, request):
+        # Prefetch assignees so get_assignees does not hit the DB per row
+        return (
+            super()
+            .get_queryset(request)
+            .select_related("project", "task_type")
+            .prefetch_related("assignees")
+        )
+
     def get_assignees(self, obj):
         return ", ".join([employee.username for employee in obj.assignees.all()])
 
@@ -130,6 +190,9 @@ class TaskAdmin(admin.ModelAdmin):
 
 @admin.register(Comment)
 class CommentAdmin(admin.ModelAdmin):
+    paginator = EstimateCountPaginator
+    show_full_result_count = False
+    list_select_related = ("employee", "task")
     list_display = ("employee", "task", "created_at")
     search_fields = ("content", "employee__username", "task__name")
     list_filter = ("created_at",)
\ No newline at end of file
@@ -0,0 +1,20 @@
+from django.contrib.auth.backends import ModelBackend
+
+from tracker.models import Employee
+
+
+class PositionSelectRelatedBackend(ModelBackend):
+    """ModelBackend that loads the session user with their position.
+
+    The default backend fetches the bare user row, so every view that
+    rendered request.user.position paid an extra SELECT (or re-fetched
+    the Employee with select_related). Joining the position here lets
+    views use request.user directly.
+    """
+
+    def get_user(self, user_id):
+        try:
+            user = Employee.objects.select_related("position").get(pk=user_id)
+        except Employee.DoesNotExist:
+            return None
+        return user if self.user_can_authenticate(user) else None
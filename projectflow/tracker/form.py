@@ -1,4 +1,5 @@
 from django import forms
+from django.core.cache import cache
 from django.contrib.auth.forms import (
     UserCreationForm,
     PasswordChangeForm,
@@ -23,6 +24,8 @@ STATUS_CHOICES = [
     ("completed", "Completed"),
 ]
 
+PRIORITY_CHOICES_WITH_ALL = [("all", "All priorities"), *PRIORITY_CHOICES]
+
 
 class RegistrationForm(UserCreationForm):
     position = forms.CharField(
@@ -83,11 +86,29 @@ class CreateTeamForm(forms.ModelForm):
         return clean_ids_field(self, "member_ids", Employee)
 
     def save(self, commit=True):
+        is_new = self.instance.pk is None
         team = super().save(commit=False)
+        member_ids = list(dict.fromkeys(self.cleaned_data["member_ids"]))
+        if is_new:
+            # A fresh team has no members, so the DELETE half of .set()
+            # is pure waste; bulk-insert the through rows directly.
+            # bulk_create skips the m2m_changed receiver, so set the
+            # denormalized count up front.
+            team.member_count = len(member_ids)
         if commit:
             team.save()
-        members = self.cleaned_data["member_ids"]
-        team.members.set(members)
+        if is_new:
+            Team.members.through.objects.bulk_create(
+                Team.members.through(team_id=team.pk, employee_id=member_id)
+                for member_id in member_ids
+            )
+            # bulk_create also skips the cache-invalidation receivers,
+            # so drop the members' cached team choices here
+            cache.delete_many(
+                [f"user-teams:{member_id}" for member_id in member_ids]
+            )
+        else:
+            team.members.set(member_ids)
         return team
 
 
@@ -105,8 +126,8 @@ class CreateProjectForm(forms.ModelForm):
 
     def save(self, commit=True):
         project = super().save(commit=False)
-        team_name = self.cleaned_data["teams_choice"]
-        project.team = Team.objects.get(name=team_name)
+        # teams_choice is already a Team instance; no need to re-fetch it
+        project.team = self.cleaned_data["teams_choice"]
         if commit:
             project.save()
         return project
@@ -137,7 +158,14 @@ class CreateTasksForm(forms.ModelForm):
     def __init__(self, *args, **kwargs):
         self.user = kwargs.pop("user")
         super().__init__(*args, **kwargs)
-        project_queryset = Project.objects.filter(team__members=self.user)
+        # distinct() guards against duplicate rows from the members join;
+        # only() keeps the option labels (Project.__str__) from dragging
+        # in every column
+        project_queryset = (
+            Project.objects.filter(team__members=self.user)
+            .only("id", "name", "deadline", "is_completed")
+            .distinct()
+        )
         self.fields["project_choice"].queryset = project_queryset
         if not self.instance.pk:
             self.fields["assignees_ids"].initial = str(self.user.id)
@@ -176,17 +204,20 @@ class AddMemberForm(forms.ModelForm):
 
     def clean_employee_id(self):
         employee_id = self.cleaned_data.get("employee_id")
-        team = Team.objects.get(pk=self.team_id)
-        if self.user and employee_id == self.user.id:
-            raise forms.ValidationError("You are already on the team.")
         if not employee_id:
             raise forms.ValidationError(
                 "Employee ID cannot be empty. Please enter a valid ID."
             )
-        if team.members.filter(id=employee_id).exists():
-            raise forms.ValidationError("Member already in the team")
+        if self.user and employee_id == self.user.id:
+            raise forms.ValidationError("You are already on the team.")
         if not Employee.objects.filter(id=employee_id).exists():
             raise forms.ValidationError(f"Worker with ID '{employee_id}' does not exist.")
+        # Check membership against the through table directly instead of
+        # loading the whole Team instance first
+        if Team.members.through.objects.filter(
+            team_id=self.team_id, employee_id=employee_id
+        ).exists():
+            raise forms.ValidationError("Member already in the team")
         return employee_id
 
 
@@ -205,10 +236,10 @@ class UpdateTeamForm(forms.ModelForm):
         super().__init__(*args, **kwargs)
 
         if self.instance and self.instance.pk:
-            members = self.instance.members.all()
-            self.fields["member_ids"].initial = ", ".join(
-                str(employee.id) for employee in members
-            )
+            # Only the PKs are needed for the initial value; skip
+            # hydrating full Employee instances
+            member_ids = self.instance.members.values_list("id", flat=True)
+            self.fields["member_ids"].initial = ", ".join(map(str, member_ids))
 
     def clean_member_ids(self):
         return clean_ids_field(self, "member_ids", Employee)
@@ -241,14 +272,21 @@ class UpdateTaskForm(forms.ModelForm):
     def __init__(self, *args, **kwargs):
         self.user = kwargs.pop("user", None)
         super().__init__(*args, **kwargs)
-        project_queryset = Project.objects.filter(team__members=self.user)
+        # distinct() guards against duplicate rows from the members join;
+        # only() keeps the option labels (Project.__str__) from dragging
+        # in every column
+        project_queryset = (
+            Project.objects.filter(team__members=self.user)
+            .only("id", "name", "deadline", "is_completed")
+            .distinct()
+        )
         self.fields["project_choice"].queryset = project_queryset
 
         if self.instance and self.instance.pk:
-            assignees = self.instance.assignees.all()
-            self.fields["assignees_ids"].initial = ", ".join(
-                str(worker.id) for worker in assignees
-            )
+            # Only the PKs are needed for the initial value; skip
+            # hydrating full Employee instances
+            assignee_ids = self.instance.assignees.values_list("id", flat=True)
+            self.fields["assignees_ids"].initial = ", ".join(map(str, assignee_ids))
 
     def clean_assignees_ids(self):
         return clean_ids_field(self, "assignees_ids", Employee)
@@ -273,23 +311,25 @@ class StatusFilterForm(forms.Form):
 
 
 class TaskFilterForm(forms.Form):
-    PRIORITY_CHOICES.insert(0, (("all", "All priorities")))
-    team_choices = lambda: [
-        (team.id, team.name) for team in Team.objects.all()
-    ]
-
     status = forms.ChoiceField(choices=STATUS_CHOICES, required=False)
-    priority = forms.ChoiceField(choices=PRIORITY_CHOICES, required=False)
-    team = forms.ChoiceField(choices=team_choices, required=False)
+    priority = forms.ChoiceField(choices=PRIORITY_CHOICES_WITH_ALL, required=False)
+    team = forms.ChoiceField(choices=[("all", "All teams")], required=False)
 
     def __init__(self, *args, **kwargs):
         self.user = kwargs.pop("user", None)
         super().__init__(*args, **kwargs)
 
         if self.user:
-            self.fields["team"].choices = [(("all", "All teams"))] + [
-                (team.id, team.name) for team in Team.objects.filter(members=self.user)
-            ]
+            # Cached per user; the Team signals drop the key whenever
+            # the user's memberships or a team's name change
+            team_choices = cache.get_or_set(
+                f"user-teams:{self.user.id}",
+                lambda: list(
+                    Team.objects.filter(members=self.user).values_list("id", "name")
+                ),
+                60 * 5,
+            )
+            self.fields["team"].choices = [("all", "All teams"), *team_choices]
 
 
 class EmployeeChangePasswordForm(PasswordChangeForm):
@@ -0,0 +1,25 @@
+# Generated by Django 6.0 on 2026-01-06 13:31
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tracker', '0002_alter_comment_task_alter_employee_position'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='comment',
+            name='employee',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='comment', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AlterField(
+            model_name='employee',
+            name='position',
+            field=models.ForeignKey(null=True, on_delete=django.db.models.deletion.CASCADE, related_name='employees', to='tracker.position'),
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 6.0 on 2026-08-31 20:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tracker', '0004_alter_comment_employee_alter_comment_task'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(fields=['project', 'deadline'], name='tracker_tas_project_0f14e9_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(fields=['task_type', 'is_completed'], name='tracker_tas_task_ty_601e9e_idx'),
+        ),
+    ]
@@ -0,0 +1,25 @@
+# Generated by Django 6.0 on 2026-08-31 20:55
+
+from django.db import migrations, models
+
+
+def backfill_member_count(apps, schema_editor):
+    Team = apps.get_model('tracker', 'Team')
+    for team in Team.objects.all():
+        Team.objects.filter(pk=team.pk).update(member_count=team.members.count())
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tracker', '0005_task_tracker_tas_project_0f14e9_idx_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='team',
+            name='member_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.RunPython(backfill_member_count, migrations.RunPython.noop),
+    ]
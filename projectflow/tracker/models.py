@@ -1,10 +1,47 @@
+import time
+from functools import lru_cache
+
 from django.contrib.auth.models import AbstractUser
+from django.core.cache import cache
 from django.core.exceptions import ValidationError
 from django.db import models
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.dispatch import receiver
 from django.utils import timezone
 
 from projectflow.settings import AUTH_USER_MODEL
 
+
+@lru_cache(maxsize=1)
+def _today_cached(minute_bucket):
+    return timezone.now().date()
+
+
+def _today():
+    # Memoize the current date per minute so bulk validation does not
+    # rebuild a tz-aware datetime for every row
+    return _today_cached(int(time.time()) // 60)
+
+
+def profile_cache_version(user_id):
+    """Current cache version for a user's profile fragments."""
+    return cache.get(f"profile-version:{user_id}", 0)
+
+
+def bump_profile_cache_version(user_ids):
+    """Invalidate cached profile fragments for the given users.
+
+    Bumping a per-user version number retires old keys without having
+    to scan or delete them.
+    """
+    for user_id in user_ids:
+        key = f"profile-version:{user_id}"
+        try:
+            cache.incr(key)
+        except ValueError:
+            cache.set(key, 1, None)
+
+
 PRIORITY_CHOICES = [
     ("urgent", "Urgent"),
     ("high", "High"),
@@ -55,6 +92,9 @@ class Team(models.Model):
         related_name="teams",
         blank=True,
     )
+    # Denormalized count maintained by the m2m_changed receiver below,
+    # so list pages can show it without touching the through table
+    member_count = models.PositiveIntegerField(default=0, editable=False)
 
     class Meta:
         ordering = ["name"]
@@ -63,6 +103,19 @@ class Team(models.Model):
         return self.name
 
 
+@receiver(m2m_changed, sender=Team.members.through)
+def update_team_member_count(sender, instance, action, reverse, pk_set, **kwargs):
+    if action not in ("post_add", "post_remove", "post_clear"):
+        return
+    team_ids = pk_set if reverse else {instance.pk}
+    for team_id in team_ids or ():
+        Team.objects.filter(pk=team_id).update(
+            member_count=Team.members.through.objects.filter(
+                team_id=team_id
+            ).count()
+        )
+
+
 class Project(models.Model):
     name = models.CharField(max_length=100, unique=True, db_index=True)
     description = models.TextField(blank=True)
@@ -77,6 +130,9 @@ class Project(models.Model):
 
     class Meta:
         ordering = ["deadline"]
+        indexes = [
+            models.Index(fields=["team", "is_completed"]),
+        ]
 
     def status_display(self):
         return "Completed" if self.is_completed else "In Progress"
@@ -86,13 +142,9 @@ class Project(models.Model):
 
     def clean(self):
         super().clean()
-        if self.deadline <= timezone.now().date():
+        if self.deadline <= _today():
             raise ValidationError({"deadline": "The deadline cannot be in the past."})
 
-    def save(self, *args, **kwargs):
-        self.full_clean()
-        super().save(*args, **kwargs)
-
 
 class Task(models.Model):
     name = models.CharField(max_length=100, unique=True, db_index=True)
@@ -125,6 +177,10 @@ class Task(models.Model):
         ordering = ["deadline"]
         indexes = [
             models.Index(fields=["deadline", "is_completed", "priority"]),
+            models.Index(fields=["project", "deadline"]),
+            models.Index(fields=["task_type", "is_completed"]),
+            models.Index(fields=["project", "is_completed"]),
+            models.Index(fields=["is_completed", "priority"]),
         ]
 
     def status_display(self):
@@ -135,13 +191,9 @@ class Task(models.Model):
 
     def clean(self):
         super().clean()
-        if self.deadline <= timezone.now().date():
+        if self.deadline <= _today():
             raise ValidationError({"deadline": "The deadline cannot be in the past."})
 
-    def save(self, *args, **kwargs):
-        self.full_clean()
-        super().save(*args, **kwargs)
-
 
 class Comment(models.Model):
     employee = models.ForeignKey(
@@ -157,4 +209,53 @@ class Comment(models.Model):
         ordering = ["-created_at"]
 
     def __str__(self) -> str:
-        return f"Comment by {self.employee} on {self.task} ({self.created_at})"
\ No newline at end of file
+        return f"Comment by {self.employee} on {self.task} ({self.created_at})"
+
+
+@receiver([post_save, post_delete], sender=Task)
+def invalidate_assignee_profile_cache(sender, instance, **kwargs):
+    bump_profile_cache_version(instance.assignees.values_list("id", flat=True))
+
+
+@receiver([post_save, post_delete], sender=Project)
+def invalidate_team_profile_cache(sender, instance, **kwargs):
+    bump_profile_cache_version(
+        Team.members.through.objects.filter(team_id=instance.team_id).values_list(
+            "employee_id", flat=True
+        )
+    )
+
+
+@receiver(m2m_changed, sender=Task.assignees.through)
+def invalidate_profile_cache_on_assignment(
+    sender, instance, action, reverse, pk_set, **kwargs
+):
+    if action not in ("post_add", "post_remove", "post_clear"):
+        return
+    employee_ids = {instance.pk} if reverse else (pk_set or set())
+    bump_profile_cache_version(employee_ids)
+
+
+@receiver(m2m_changed, sender=Team.members.through)
+def invalidate_profile_cache_on_membership(
+    sender, instance, action, reverse, pk_set, **kwargs
+):
+    if action not in ("post_add", "post_remove", "post_clear"):
+        return
+    employee_ids = pk_set if not reverse else {instance.pk}
+    bump_profile_cache_version(employee_ids or set())
+    cache.delete_many(
+        [f"user-teams:{employee_id}" for employee_id in (employee_ids or set())]
+    )
+
+
+@receiver([post_save, post_delete], sender=Team)
+def invalidate_team_choice_cache(sender, instance, **kwargs):
+    cache.delete_many(
+        [
+            f"user-teams:{employee_id}"
+            for employee_id in Team.members.through.objects.filter(
+                team_id=instance.pk
+            ).values_list("employee_id", flat=True)
+        ]
+    )
\ No newline at end of file
@@ -1,5 +1,10 @@
+import re
+
 from django import forms
 
+_ID_RE = re.compile(r"\d+")
+_INVALID_ID_CHARS_RE = re.compile(r"[^\d,\s]")
+
 
 def clean_ids_field(self, field_name, model_class):
     """
@@ -7,7 +12,7 @@ def clean_ids_field(self, field_name, model_class):
 
     :param field_name: The name of the field to clean (e.g., 'assignees_ids').
     :param model_class: The model class to check the IDs against (e.g., Employee).
-    :return: A queryset of valid objects matching the IDs.
+    :return: A list of validated integer IDs.
     """
     data_ids = self.cleaned_data.get(field_name)
 
@@ -16,23 +21,27 @@ def clean_ids_field(self, field_name, model_class):
             f"{field_name.replace('_', ' ').capitalize()} "
             f"cannot be empty. Please enter valid IDs."
         )
-    ids = [id.strip() for id in data_ids.split(",") if id.strip()]
+    if _INVALID_ID_CHARS_RE.search(data_ids):
+        raise forms.ValidationError("All IDs must be valid integers.")
+    # Single regex pass over the input instead of split + strip + int()
+    ids = list(map(int, _ID_RE.findall(data_ids)))
     if not ids:
         raise forms.ValidationError(
             f"{field_name.replace('_', ' ').capitalize()} "
             f"cannot be empty. Please enter valid IDs."
         )
-    try:
-        ids = [int(id) for id in ids]
-    except ValueError:
-        raise forms.ValidationError("All IDs must be valid integers.")
-    objects = model_class.objects.filter(pk__in=ids)
-    if len(objects) != len(ids):
+    # Compare PK sets instead of hydrating models just to count them;
+    # this also catches duplicates in the input
+    existing = set(
+        model_class.objects.filter(pk__in=ids).values_list("pk", flat=True)
+    )
+    missing = set(ids) - existing
+    if missing:
         raise forms.ValidationError(
             f"One or more {field_name.replace('_', ' ')} "
-            f"IDs are invalid. Please check the IDs."
+            f"IDs are invalid: {', '.join(str(id) for id in sorted(missing))}."
         )
-    return objects
+    return ids
 
 
 def clean_project_name(self, field_name, model_class):
@@ -48,10 +57,13 @@ def clean_project_name(self, field_name, model_class):
         raise forms.ValidationError(
             "Project name cannot be empty. Please enter a valid name."
         )
-    try:
-        project = model_class.objects.get(name=project_name)
-        return project
-    except model_class.DoesNotExist:
+    # first() avoids the DoesNotExist exception on the miss path and
+    # only() skips the columns validation never reads
+    project = (
+        model_class.objects.filter(name=project_name).only("id", "name").first()
+    )
+    if project is None:
         raise forms.ValidationError(
             f"Project with name '{project_name}' does not exist."
-        )
\ No newline at end of file
+        )
+    return project
\ No newline at end of file
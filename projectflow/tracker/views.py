@@ -1,10 +1,15 @@
+import hashlib
+from functools import cached_property
+from itertools import islice
+
 from django.contrib.auth import login
 from django.contrib.auth.decorators import login_required
 from django.contrib.auth.mixins import LoginRequiredMixin
 from django.contrib.auth.views import PasswordChangeView, PasswordResetView
-from django.core.paginator import Paginator
+from django.core.cache import cache
+from django.core.paginator import Page, Paginator
 from django.db import transaction
-from django.db.models import Count, Q
+from django.db.models import Count, Exists, F, OuterRef, Prefetch, Q
 from django.http import (
     HttpRequest,
     HttpResponse,
@@ -13,6 +18,8 @@ from django.http import (
 from django.shortcuts import render, redirect, get_object_or_404
 from django.urls import reverse_lazy
 from django.views import generic, View
+from django.views.decorators.cache import cache_page
+from django.views.decorators.vary import vary_on_cookie
 
 from tracker.form import (
     RegistrationForm,
@@ -29,9 +36,31 @@ from tracker.form import (
     EmployeeChangePasswordForm,
     ResetPasswordEmailForm,
 )
-from tracker.models import Employee, Project, Position, Team, Task, TaskType, Comment
+from tracker.models import (
+    Employee,
+    Project,
+    Position,
+    Team,
+    Task,
+    TaskType,
+    Comment,
+    profile_cache_version,
+)
+
 
+# Maps a filter-form status value onto its queryset filter kwargs
+STATUS_FILTERS = {
+    "active": {"is_completed": False},
+    "completed": {"is_completed": True},
+}
 
+
+# vary_on_cookie must sit under cache_page: the header include renders
+# the logged-in user, and cache_page stores the response before
+# SessionMiddleware would patch Vary, so without the decorator one
+# user's page would be served to everyone
+@cache_page(60 * 5)
+@vary_on_cookie
 def get_index_page(request: HttpRequest) -> HttpResponse:
     return render(request, "index.html")
 
@@ -54,7 +83,110 @@ def sign_up(request: HttpRequest) -> HttpResponse:
     )
 
 
-def pagination(request: HttpRequest, queryset, items_per_page=5):
+class CachedCountPaginator(Paginator):
+    """Paginator that memoizes its COUNT(*) in the cache for a short TTL.
+
+    Page-flipping reissues the same aggregate on every click; a 30s
+    cache keyed on the query SQL skips that without letting the page
+    links go stale for long.
+    """
+
+    count_timeout = 30
+
+    @cached_property
+    def count(self):
+        if not hasattr(self.object_list, "query"):
+            return super().count
+        key = "paginator-count:" + hashlib.md5(
+            str(self.object_list.query).encode()
+        ).hexdigest()
+        count = cache.get(key)
+        if count is None:
+            count = super().count
+            cache.set(key, count, self.count_timeout)
+        return count
+
+
+class PkInPaginator(CachedCountPaginator):
+    """Paginator that slices pk values first, then re-selects the page.
+
+    With joined/wide querysets the DB otherwise materializes every
+    column of every row before applying LIMIT/OFFSET; slicing just the
+    pk column and re-querying with pk__in runs the joins only for the
+    rows actually shown.
+    """
+
+    def page(self, number):
+        if not hasattr(self.object_list, "values_list"):
+            return super().page(number)
+        number = self.validate_number(number)
+        bottom = (number - 1) * self.per_page
+        top = bottom + self.per_page
+        pks = self.object_list.values_list("pk", flat=True)[bottom:top]
+        return self._get_page(self.object_list.filter(pk__in=pks), number, self)
+
+
+class StreamingPage(Page):
+    """Page that answers has_next from a peeked row, never from count.
+
+    The inherited next/previous page numbers route through
+    validate_number and therefore num_pages, which would both issue the
+    COUNT(*) this paginator exists to avoid and raise EmptyPage for
+    pages it never validated, so they are simple arithmetic here.
+    """
+
+    def __init__(self, object_list, number, paginator, has_next):
+        super().__init__(object_list, number, paginator)
+        self._has_next = has_next
+
+    def has_next(self):
+        return self._has_next
+
+    def next_page_number(self):
+        return self.number + 1
+
+    def previous_page_number(self):
+        return self.number - 1
+
+
+class StreamingPaginator(Paginator):
+    """Paginator that never issues COUNT(*) or loads the full queryset.
+
+    Rows are pulled through queryset.iterator() in small chunks and the
+    page slice is taken with islice, peeking one extra row to decide
+    has_next; memory stays O(per_page) regardless of table size, at the
+    cost of not knowing the total page count.
+    """
+
+    def page(self, number):
+        # validate_number would touch num_pages (and thus count), so
+        # clamp the page number by hand
+        try:
+            number = int(number)
+        except (TypeError, ValueError):
+            number = 1
+        number = max(number, 1)
+        rows = self._slice(number)
+        if not rows and number > 1:
+            # Past the end; fall back to the first page the way
+            # get_page() clamps, but without knowing the last page
+            number = 1
+            rows = self._slice(number)
+        has_next = len(rows) > self.per_page
+        return StreamingPage(rows[: self.per_page], number, self, has_next)
+
+    def _slice(self, number):
+        bottom = (number - 1) * self.per_page
+        return list(
+            islice(
+                self.object_list.iterator(chunk_size=self.per_page * 2),
+                bottom,
+                bottom + self.per_page + 1,
+            )
+        )
+
+
+def pagination(request: HttpRequest, queryset, items_per_page=5, count=True):
     """
     Function for pagination.
 
@@ -62,53 +194,102 @@ def pagination(request: HttpRequest, queryset, items_per_page=5):
         request: HttpRequest - the request object.
         queryset: QuerySet or list - the data to paginate.
         items_per_page: int - number of items per page (default is 5).
+        count: bool - when False, use StreamingPaginator and skip the
+            COUNT(*) (the page object then has no num_pages).
 
     Returns:
         page_obj: pagination object for the template.
     """
 
-    paginator = Paginator(queryset, items_per_page)
-    page_number = request.GET.get("page")
-    page_obj = paginator.get_page(page_number)
-    return page_obj
+    if count:
+        paginator = PkInPaginator(queryset, items_per_page)
+        page_number = request.GET.get("page")
+        return paginator.get_page(page_number)
+    paginator = StreamingPaginator(queryset, items_per_page)
+    return paginator.page(request.GET.get("page"))
+
+
+class KeysetPage:
+    """Lightweight page object returned by keyset_paginate."""
+
+    def __init__(self, object_list, has_next, next_cursor):
+        self.object_list = object_list
+        self.has_next = has_next
+        self.next_cursor = next_cursor
+
+    def __iter__(self):
+        return iter(self.object_list)
+
+
+def keyset_paginate(request, queryset, items_per_page=5, order_field="id"):
+    """
+    Keyset (cursor) pagination.
+
+    Unlike Paginator, no COUNT(*) is issued and deep pages cost the same
+    as the first one: rows are selected with a WHERE on the last seen key
+    instead of an OFFSET scan.
+
+    Arguments:
+        request: HttpRequest - the request object.
+        queryset: QuerySet - the data to paginate.
+        items_per_page: int - number of items per page (default is 5).
+        order_field: str - column used as the pagination key (default "id").
+
+    Returns:
+        page: KeysetPage exposing object_list, has_next and next_cursor.
+    """
+
+    cursor = request.GET.get("cursor")
+    if cursor:
+        try:
+            queryset = queryset.filter(**{f"{order_field}__lt": int(cursor)})
+        except (TypeError, ValueError):
+            pass
+    rows = list(queryset.order_by(f"-{order_field}")[: items_per_page + 1])
+    has_next = len(rows) > items_per_page
+    rows = rows[:items_per_page]
+    next_cursor = getattr(rows[-1], order_field) if has_next else None
+    return KeysetPage(rows, has_next, next_cursor)
 
 
 @login_required
 def get_profile(request: HttpRequest) -> HttpResponse:
-    employee = (
-        Employee.objects.select_related("position")
-        .prefetch_related("teams", "tasks")
-        .only(
-            "id",
-            "position__id",
-            "position__name",
-            "position_id",
-            "username",
-            "email",
-            "first_name",
-            "last_name",
-        )
-        .get(pk=request.user.id)
-    )
-
-    tasks = employee.tasks.aggregate(
-        active_tasks=Count("id", filter=Q(is_completed=False)),
-        finished_tasks=Count("id", filter=Q(is_completed=True)),
+    # request.user already carries the position join via the auth
+    # backend, so the profile page needs no extra Employee fetch
+    employee = request.user
+
+    # One conditional aggregate per model; the counts are cached per
+    # user under a versioned key that the model signals bump on every
+    # relevant mutation, so cache hits skip both aggregates entirely
+    task_queryset = Task.objects.filter(assignees=employee)
+    counts_key = (
+        f"profile-counts:{employee.id}:v{profile_cache_version(employee.id)}"
     )
+    counts = cache.get(counts_key)
+    if counts is None:
+        counts = task_queryset.aggregate(
+            active_tasks=Count("id", filter=Q(is_completed=False)),
+            finished_tasks=Count("id", filter=Q(is_completed=True)),
+        )
+        # A project belongs to exactly one team, so an IN over the
+        # user's team ids replaces the join through the members table
+        # and keeps the counts duplicate-free by construction
+        counts.update(
+            Project.objects.filter(
+                team_id__in=employee.teams.values("id")
+            ).aggregate(
+                active_projects=Count("id", filter=Q(is_completed=False)),
+                finished_projects=Count("id", filter=Q(is_completed=True)),
+            )
+        )
+        cache.set(counts_key, counts, 60)
 
-    projects = Project.objects.filter(team__members=employee).aggregate(
-        active_projects=Count("id", filter=Q(is_completed=False)),
-        finished_projects=Count("id", filter=Q(is_completed=True)),
-    )
-    tasks_for_page = employee.tasks.filter(is_completed=False)
+    tasks_for_page = task_queryset.filter(is_completed=False)
     page_obj = pagination(request, tasks_for_page, items_per_page=5)
     context = {
         "employee": employee,
-        "active_tasks": tasks["active_tasks"],
-        "finished_tasks": tasks["finished_tasks"],
-        "active_projects": projects["active_projects"],
-        "finished_projects": projects["finished_projects"],
         "page_obj": page_obj,
+        **counts,
     }
 
     return render(request, "profile/profile.html", context=context)
@@ -116,22 +297,23 @@ def get_profile(request: HttpRequest) -> HttpResponse:
 
 @login_required
 def projects_page_view(request: HttpRequest) -> HttpResponse:
-    employee = Employee.objects.select_related("position").get(pk=request.user.id)
+    # request.user is already the Employee (with position joined by the
+    # auth backend); no need to re-fetch it
+    employee = request.user
     employee_team = employee.teams.all()
+    # Collect all filters into one dict so the queryset is cloned once
+    filter_kwargs = {"team__in": employee_team}
+    form = StatusFilterForm(request.GET)
+    if form.is_valid():
+        status = form.cleaned_data.get("status")
+        if status in STATUS_FILTERS:
+            filter_kwargs.update(STATUS_FILTERS[status])
     employee_projects = (
-        Project.objects.filter(team__in=employee_team)
+        Project.objects.filter(**filter_kwargs)
         .select_related("team")
         .prefetch_related("team__members")
     )
-    form = StatusFilterForm(request.GET)
-    if form.is_valid():
-        status = form.cleaned_data.get("status")
-        if status and status != "all":
-            if status == "completed":
-                employee_projects = employee_projects.filter(is_completed=True)
-            elif status == "active":
-                employee_projects = employee_projects.filter(is_completed=False)
-    page_obj = pagination(request, employee_projects, items_per_page=8)
+    page_obj = keyset_paginate(request, employee_projects, items_per_page=8)
     context = {
         "employee_projects": employee_projects,
         "page_obj": page_obj,
@@ -141,12 +323,16 @@ def projects_page_view(request: HttpRequest) -> HttpResponse:
 
 @login_required
 def teams_page_view(request: HttpRequest) -> HttpResponse:
-    employee = (
-        Employee.objects.select_related("position")
-        .prefetch_related("teams")
-        .get(pk=request.user.id)
+    employee = request.user
+    # A scalar annotation per team instead of prefetching every project
+    # row; member_count is the denormalized column on the model. The
+    # GROUP BY drops Team.Meta.ordering, so reapply it explicitly to
+    # keep the page slices stable
+    employee_teams = (
+        employee.teams.annotate(project_count=Count("projects", distinct=True))
+        .only("id", "name", "description", "member_count")
+        .order_by("name")
     )
-    employee_teams = employee.teams.all()
     page_obj = pagination(request, employee_teams, 8)
     context = {
         "page_obj": page_obj,
@@ -156,10 +342,25 @@ def teams_page_view(request: HttpRequest) -> HttpResponse:
 
 @login_required
 def tasks_page_view(request: HttpRequest) -> HttpResponse:
-    employee = Employee.objects.select_related("position").get(pk=request.user.id)
+    employee = request.user
+
+    # Collect all filters into one dict so the queryset is cloned once,
+    # with the filter applied before the .only() projection
+    filter_kwargs = {"project__team__members": employee}
+    form = TaskFilterForm(request.GET, user=request.user)
+    if form.is_valid():
+        status = form.cleaned_data.get("status")
+        priority = form.cleaned_data.get("priority")
+        team = form.cleaned_data.get("team")
+        if status in STATUS_FILTERS:
+            filter_kwargs.update(STATUS_FILTERS[status])
+        if priority and priority != "all":
+            filter_kwargs["priority"] = priority
+        if team and team != "all":
+            filter_kwargs["project__team_id"] = team
 
     employee_tasks = (
-        Task.objects.filter(project__team__members=employee)
+        Task.objects.filter(**filter_kwargs)
         .select_related("task_type", "project__team")
         .only(
             "id",
@@ -171,24 +372,7 @@ def tasks_page_view(request: HttpRequest) -> HttpResponse:
             "project__team__name",
         )
     )
-
-    form = TaskFilterForm(request.GET, user=request.user)
-    if form.is_valid():
-        status = form.cleaned_data.get("status")
-        priority = form.cleaned_data.get("priority")
-        team = form.cleaned_data.get("team")
-        if status and status != "all":
-            if status == "active":
-                employee_tasks = employee_tasks.filter(is_completed=False)
-            elif status == "completed":
-                employee_tasks = employee_tasks.filter(is_completed=True)
-
-        if priority and priority != "all":
-            employee_tasks = employee_tasks.filter(priority=priority)
-
-        if team and team != "all":
-            employee_tasks = employee_tasks.filter(project__team_id=team)
-    page_obj = pagination(request, employee_tasks, items_per_page=6)
+    page_obj = keyset_paginate(request, employee_tasks, items_per_page=6)
     context = {
         "page_obj": page_obj,
         "form": form,
@@ -253,21 +437,61 @@ def create_task_form_view(request: HttpRequest) -> HttpResponse:
 @transaction.atomic
 @login_required
 def task_details_page_view(request: HttpRequest, pk: int) -> HttpResponse:
-    task = (
-        Task.objects.select_related("project__team", "task_type")
-        .prefetch_related("assignees", "assignees__position", "comments__employee")
-        .get(pk=pk)
-    )
+    # Handle the comment POST first: it only needs the pk from the URL,
+    # so the successful path never runs the heavy detail queryset
     if request.method == "POST":
         comment_form = CreateCommentForm(request.POST)
         if comment_form.is_valid():
-            new_comment = comment_form.save(commit=False)
-            new_comment.employee = request.user
-            new_comment.task = task
-            new_comment.save()
-            return redirect("tracker:task-details", pk=task.pk)
+            # Single INSERT with both FKs by id; no intermediate model
+            # instance or FK object fetch
+            Comment.objects.create(
+                task_id=pk,
+                employee_id=request.user.id,
+                content=comment_form.cleaned_data["content"],
+            )
+            return redirect("tracker:task-details", pk=pk)
     else:
         comment_form = CreateCommentForm()
+
+    # only() trims each joined row to the columns the template renders
+    task = (
+        Task.objects.select_related("project__team", "task_type")
+        .only(
+            "id",
+            "name",
+            "description",
+            "deadline",
+            "priority",
+            "is_completed",
+            "created_at",
+            "project__id",
+            "project__name",
+            "project__team__id",
+            "project__team__name",
+            "task_type__id",
+            "task_type__name",
+        )
+        .prefetch_related(
+            Prefetch(
+                "assignees",
+                queryset=Employee.objects.select_related("position").only(
+                    "id", "username", "position_id", "position__id", "position__name"
+                ),
+            ),
+            Prefetch(
+                "comments",
+                queryset=Comment.objects.select_related("employee").only(
+                    "id",
+                    "content",
+                    "created_at",
+                    "task_id",
+                    "employee__id",
+                    "employee__username",
+                ),
+            ),
+        )
+        .get(pk=pk)
+    )
     context = {
         "task": task,
         "comment_form": comment_form,
@@ -277,9 +501,20 @@ def task_details_page_view(request: HttpRequest, pk: int) -> HttpResponse:
 
 @login_required
 def team_details_page_view(request: HttpRequest, pk: int) -> HttpResponse:
-    team = Team.objects.prefetch_related("members__position", "projects").get(pk=pk)
-    team_projects = team.projects.all()
-    page_obj = pagination(request, team_projects, 4)
+    team = Team.objects.prefetch_related("members__position").get(pk=pk)
+    # Paginated without a COUNT(*): only the rows of the current page
+    # (plus one peeked row) are ever materialized. The GROUP BY from
+    # the annotations drops Project.Meta.ordering, so reapply it
+    # explicitly to keep the page slices stable
+    team_projects = (
+        Project.objects.filter(team_id=pk)
+        .annotate(
+            total_tasks=Count("tasks"),
+            active_tasks=Count("tasks", filter=Q(tasks__is_completed=False)),
+        )
+        .order_by("deadline")
+    )
+    page_obj = pagination(request, team_projects, 4, count=False)
     return render(
         request,
         "teams/team_profile.html",
@@ -287,9 +522,48 @@ def team_details_page_view(request: HttpRequest, pk: int) -> HttpResponse:
     )
 
 
-class AddNewMemberToTeam(LoginRequiredMixin, generic.FormView):
+class TeamMemberPermissionMixin:
+    """Fetch the target object once and permission-check it in dispatch.
+
+    The dispatch overrides previously fetched the row for the membership
+    check and the generic view's get_object() then fetched it again; the
+    object is cached on the view instead, and the membership test is
+    folded into the same query as an EXISTS against the m2m through
+    table, so the member rows are never fetched at all.
+
+    The generic update/delete views fold membership into get_queryset
+    and 404 instead; this mixin backs the member-management views that
+    have no get_object() and render a dedicated permission page.
+    """
+
+    permission_queryset = None
+    team_ref = "pk"
+
+    def dispatch(self, request, *args, **kwargs):
+        pk = kwargs.get("pk", kwargs.get("team_pk"))
+        self.object = get_object_or_404(
+            self.permission_queryset.annotate(
+                is_member=Exists(
+                    Team.members.through.objects.filter(
+                        team_id=OuterRef(self.team_ref),
+                        employee_id=request.user.id,
+                    )
+                )
+            ),
+            pk=pk,
+        )
+        if not self.object.is_member:
+            return render(request, "permission.html")
+        return super().dispatch(request, *args, **kwargs)
+
+    def get_object(self, queryset=None):
+        return self.object
+
+
+class AddNewMemberToTeam(LoginRequiredMixin, TeamMemberPermissionMixin, generic.FormView):
     form_class = AddMemberForm
     template_name = "forms/add_new_member.html"
+    permission_queryset = Team.objects.all()
 
     def get_form_kwargs(self):
         kwargs = super().get_form_kwargs()
@@ -297,41 +571,35 @@ class AddNewMemberToTeam(LoginRequiredMixin, generic.FormView):
         kwargs["team"] = self.kwargs["pk"]
         return kwargs
 
-    def dispatch(self, request, *args, **kwargs):
-        team = get_object_or_404(
-            Team.objects.prefetch_related("members"), pk=self.kwargs["pk"]
-        )
-        if not team.members.filter(id=request.user.id).exists():
-            return render(request, "permission.html")
-        return super().dispatch(request, *args, **kwargs)
-
     @transaction.atomic
     def form_valid(self, form):
-        team = get_object_or_404(Team, pk=self.kwargs["pk"])
         member_id = form.cleaned_data["employee_id"]
-        new_member = get_object_or_404(Employee, id=member_id)
-        if new_member not in team.members.all():
-            team.members.add(new_member)
-            team.save()
+        # INSERT-if-missing in one round-trip instead of loading the
+        # whole member list for a Python-side membership test; the form
+        # already validated that the employee exists
+        _, created = Team.members.through.objects.get_or_create(
+            team_id=self.kwargs["pk"], employee_id=member_id
+        )
+        if created:
+            # get_or_create on the through table skips the m2m_changed
+            # receiver, so bump the denormalized count and drop the new
+            # member's cached team choices here
+            Team.objects.filter(pk=self.kwargs["pk"]).update(
+                member_count=F("member_count") + 1
+            )
+            cache.delete(f"user-teams:{member_id}")
         return super().form_valid(form)
 
     def get_success_url(self):
         return reverse_lazy("tracker:team-details", kwargs={"pk": self.kwargs["pk"]})
 
 
-class DeleteMemberFromTeam(LoginRequiredMixin, View):
+class DeleteMemberFromTeam(LoginRequiredMixin, TeamMemberPermissionMixin, View):
     template_name = "forms/confirm_delete_member.html"
-
-    def dispatch(self, request, *args, **kwargs):
-        team = get_object_or_404(
-            Team.objects.prefetch_related("members"), pk=kwargs["team_pk"]
-        )
-        if not team.members.filter(id=request.user.id).exists():
-            return render(request, "permission.html")
-        return super().dispatch(request, *args, **kwargs)
+    permission_queryset = Team.objects.all()
 
     def get(self, request, *args, **kwargs):
-        team = get_object_or_404(Team, pk=kwargs["team_pk"])
+        team = self.object
         member_to_delete = get_object_or_404(Employee, id=kwargs["member_pk"])
         error = kwargs.get("error", None)
         return render(
@@ -342,7 +610,7 @@ class DeleteMemberFromTeam(LoginRequiredMixin, View):
 
     @transaction.atomic
     def post(self, request, *args, **kwargs):
-        team = get_object_or_404(Team, pk=kwargs["team_pk"])
+        team = self.object
         member_to_delete = get_object_or_404(Employee, id=kwargs["member_pk"])
         if member_to_delete == request.user:
             return self.get(
@@ -351,23 +619,19 @@ class DeleteMemberFromTeam(LoginRequiredMixin, View):
                 **kwargs,
                 error="You cannot delete yourself from the team."
             )
+        # m2m remove needs no team.save(); no Team column changes
         team.members.remove(member_to_delete)
-        team.save()
         return redirect("tracker:team-details", pk=team.pk)
 
 
-class DeleteProjectView(generic.DeleteView):
+class DeleteProjectView(LoginRequiredMixin, generic.DeleteView):
     model = Project
     template_name = "forms/confirm_delete_project.html"
     success_url = reverse_lazy("tracker:projects")
 
-    def dispatch(self, request, *args, **kwargs):
-        project = get_object_or_404(
-            Project.objects.prefetch_related("team__members"), pk=kwargs.get("pk")
-        )
-        if not project.team.members.filter(id=request.user.id).exists():
-            return render(request, "permission.html")
-        return super().dispatch(request, *args, **kwargs)
+    def get_queryset(self):
+        # Membership is part of the lookup: non-members simply get a 404
+        return Project.objects.filter(team__members=self.request.user)
 
     @transaction.atomic
     def delete(self, request, *args, **kwargs):
@@ -378,10 +642,24 @@ class DeleteProjectView(generic.DeleteView):
 @login_required
 def project_details_page_view(request, pk: int) -> HttpResponse:
     project = (
-        Project.objects.select_related("team").prefetch_related("tasks").get(pk=pk)
+        Project.objects.select_related("team")
+        .only(
+            "id",
+            "name",
+            "description",
+            "deadline",
+            "is_completed",
+            "team__id",
+            "team__name",
+        )
+        .get(pk=pk)
+    )
+    # Paginated without a COUNT(*): only the rows of the current page
+    # (plus one peeked row) are ever materialized
+    project_tasks = Task.objects.filter(project_id=pk).only(
+        "id", "name", "description", "deadline", "created_at", "project_id"
     )
-    project_tasks = project.tasks.all()
-    page_obj = pagination(request, project_tasks, 8)
+    page_obj = pagination(request, project_tasks, 8, count=False)
     return render(
         request,
         "projects/project_details.html",
@@ -394,13 +672,8 @@ class DeleteTaskView(LoginRequiredMixin, generic.DeleteView):
     template_name = "forms/confirm_delete_task.html"
     success_url = reverse_lazy("tracker:tasks")
 
-    def dispatch(self, request, *args, **kwargs):
-        task = get_object_or_404(
-            Task.objects.prefetch_related("project"), pk=kwargs.get("pk")
-        )
-        if not task.project.team.members.filter(id=request.user.id).exists():
-            return render(request, "permission.html")
-        return super().dispatch(request, *args, **kwargs)
+    def get_queryset(self):
+        return Task.objects.filter(project__team__members=self.request.user)
 
     @transaction.atomic
     def delete(self, request, *args, **kwargs):
@@ -413,13 +686,10 @@ class UpdateProjectView(LoginRequiredMixin, generic.UpdateView):
     form_class = UpdateProjectForm
     template_name = "projects/project_update.html"
 
-    def dispatch(self, request, *args, **kwargs):
-        project = get_object_or_404(
-            Project.objects.prefetch_related("team__members"), pk=kwargs.get("pk")
+    def get_queryset(self):
+        return Project.objects.filter(team__members=self.request.user).select_related(
+            "team"
         )
-        if not project.team.members.filter(id=request.user.id).exists():
-            return render(request, "permission.html")
-        return super().dispatch(request, *args, **kwargs)
 
     def get_form_kwargs(self):
         kwargs = super().get_form_kwargs()
@@ -443,13 +713,8 @@ class DeleteTeamView(LoginRequiredMixin, generic.DeleteView):
     template_name = "forms/confirm_delete_team.html"
     success_url = reverse_lazy("tracker:teams")
 
-    def dispatch(self, request, *args, **kwargs):
-        team = get_object_or_404(
-            Team.objects.prefetch_related("members"), pk=kwargs.get("pk")
-        )
-        if not team.members.filter(id=request.user.id).exists():
-            return render(request, "permission.html")
-        return super().dispatch(request, *args, **kwargs)
+    def get_queryset(self):
+        return Team.objects.filter(members=self.request.user)
 
     @transaction.atomic
     def delete(self, request, *args, **kwargs):
@@ -462,22 +727,28 @@ class UpdateTeamView(LoginRequiredMixin, generic.UpdateView):
     form_class = UpdateTeamForm
     template_name = "teams/team_update.html"
 
-    def dispatch(self, request, *args, **kwargs):
-        team = get_object_or_404(
-            Team.objects.prefetch_related("members"), pk=kwargs.get("pk")
-        )
-        if not team.members.filter(id=request.user.id).exists():
-            return render(request, "permission.html")
-        return super().dispatch(request, *args, **kwargs)
+    def get_queryset(self):
+        return Team.objects.filter(members=self.request.user)
 
     @transaction.atomic
     def form_valid(self, form):
-        workers = form.cleaned_data["member_ids"]
+        # form.save() rewrites every Team column, so it has to run
+        # before the m2m delta or it would clobber the member_count the
+        # m2m_changed receiver writes
+        response = super().form_valid(form)
+        workers = set(form.cleaned_data["member_ids"])
         team = self.object
-        team.members.set(workers)
-        team.save()
+        # Apply only the delta: .set() would DELETE and re-INSERT every
+        # row, and m2m changes need no extra team.save()
+        current = set(team.members.values_list("id", flat=True))
+        to_add = workers - current
+        to_remove = current - workers
+        if to_add:
+            team.members.add(*to_add)
+        if to_remove:
+            team.members.remove(*to_remove)
 
-        return super().form_valid(form)
+        return response
 
     def get_success_url(self):
         return reverse_lazy("tracker:team-details", kwargs={"pk": self.object.pk})
@@ -488,13 +759,8 @@ class UpdateTaskView(LoginRequiredMixin, generic.UpdateView):
     form_class = UpdateTaskForm
     template_name = "tasks/task_update.html"
 
-    def dispatch(self, request, *args, **kwargs):
-        task = get_object_or_404(
-            Task.objects.prefetch_related("project"), pk=kwargs.get("pk")
-        )
-        if not task.project.team.members.filter(id=request.user.id).exists():
-            return render(request, "permission.html")
-        return super().dispatch(request, *args, **kwargs)
+    def get_queryset(self):
+        return Task.objects.filter(project__team__members=self.request.user)
 
     def get_form_kwargs(self):
         kwargs = super().get_form_kwargs()